@@ -0,0 +1,101 @@
+"""Compiled kernels for the hottest Board paths (collision and line clearing).
+
+The kernels operate on the board's NumPy occupancy array and are compiled
+with numba's ``@njit(cache=True)`` when numba is installed (``cache=True``
+avoids paying the JIT cost again on later runs). Without numba the same
+functions run as plain Python, so the game works either way.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+from src.piece import ROW_MASKS
+
+# Piece row masks as int64 arrays, indexed [type][rotation], shared process-wide
+ROW_MASKS_NP = tuple(
+    tuple(np.array(masks, dtype=np.int64) for masks in rotations)
+    for rotations in ROW_MASKS
+)
+
+
+@njit(cache=True)
+def collides(occ, masks, max_row, x, y, height, full_mask):
+    """Check a piece's four row masks against boundaries and occupancy"""
+    # Floor check hoisted out of the loop via the cached bottom-most row
+    if y + max_row >= height:
+        return True
+    # Shift into a window widened by 4 bits on the left so x down to -4
+    # stays a left shift; anything further left cannot touch the board
+    if x < -4:
+        return True
+    outside = ~(full_mask << 4)
+    for i in range(4):
+        mask = masks[i]
+        if mask == 0:
+            continue
+        shifted = mask << (x + 4)
+        # Both side boundaries in one AND against the widened window
+        if shifted & outside:
+            return True
+        block_y = y + i
+        if block_y >= 0 and occ[block_y] & (shifted >> 4):
+            return True
+    return False
+
+
+@njit(cache=True)
+def collides_w10x20(occ, masks, max_row, x, y):
+    """collides() specialized for the standard 10x20 board.
+
+    Hardcoding width and height lets the full-row mask (0x3FF) and the
+    widened-window boundary mask fold into immediates.
+    """
+    if y + max_row >= 20:
+        return True
+    if x < -4:
+        return True
+    for i in range(4):
+        mask = masks[i]
+        if mask == 0:
+            continue
+        shifted = mask << (x + 4)
+        if shifted & ~0x3FF0:
+            return True
+        block_y = y + i
+        if block_y >= 0 and occ[block_y] & (shifted >> 4):
+            return True
+    return False
+
+
+@njit(cache=True)
+def clear_full_rows(occ, full_mask):
+    """Compact full rows out of occ in a single downward pass.
+
+    Returns a bitmask of the original indices of the cleared rows so the
+    caller can mirror the compaction on the color grid.
+    """
+    height = occ.shape[0]
+    cleared_mask = 0
+    write = height - 1
+    for r in range(height - 1, -1, -1):
+        if occ[r] == full_mask:
+            cleared_mask |= 1 << r
+        else:
+            occ[write] = occ[r]
+            write -= 1
+    for r in range(write, -1, -1):
+        occ[r] = 0
+    return cleared_mask
@@ -1,5 +1,20 @@
-from typing import List, Optional, Dict
-from src.piece import Piece
+from array import array
+from collections import deque
+from random import randrange
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
+
+from src import _board_kernels
+from src.piece import Piece, MAX_ROWS, BOTTOM_PER_COL
+
+# Frames between drops, indexed directly by level (index 0 unused);
+# modern Tetris speed curve - faster progression
+_SPEED_TABLE: Tuple[int, ...] = (1, 48, 43, 38, 33, 28, 23, 18, 13, 8, 6, 5, 4, 3, 2, 1)
+
+# Base score per number of lines cleared at once (index 0 unused);
+# enhanced scoring system based on modern Tetris guidelines
+_LINE_SCORES: Tuple[int, ...] = (0, 100, 300, 500, 800)
 
 class Board:
     """Tetris game board with hold piece and competitive features"""
@@ -10,7 +25,23 @@ class Board:
         self.height: int = height
         self.player_id: int = player_id
         self.opponent: Optional['Board'] = None
-        self.grid: List[List[int]] = [[0 for _ in range(width)] for _ in range(height)]
+        # Color rows as unboxed C unsigned shorts (contiguous, cache-friendly)
+        self._zero_row: array = array('H', [0] * width)
+        self.grid: List[array] = [array('H', self._zero_row) for _ in range(height)]
+        # Per-row occupancy bitmasks (bit x set = column x filled); grid keeps colors for rendering
+        self.occ: np.ndarray = np.zeros(height, dtype=np.int64)
+        self.full_row_mask: int = (1 << width) - 1
+        # Row index of the topmost filled cell per column (height if empty)
+        self.heights: List[int] = [height for _ in range(width)]
+        # Backing fields for the guard properties below
+        self._current_piece: Optional[Piece] = None
+        self._paused: bool = False
+        self._game_over: bool = False
+        self._active: bool = False
+        # Nearly every board is the standard 10x20; bind the specialized
+        # kernel with the dimensions folded in, else use the generic one
+        self._collides_fast = (_board_kernels.collides_w10x20
+                               if width == 10 and height == 20 else None)
         self.current_piece: Optional[Piece] = None
         self.next_piece: Optional[Piece] = None
         self.held_piece: Optional[Piece] = None
@@ -18,11 +49,48 @@ class Board:
         self.score: int = 0
         self.lines_cleared: int = 0
         self.level: int = 1
+        # Drop interval in ms, refreshed only when level changes
+        self.drop_interval_ms: int = _SPEED_TABLE[1] * 10
         self.game_over: bool = False
         self.paused: bool = False
         self.lines_sent: int = 0  # For competitive mode
-        self.pending_garbage: List[int] = []  # Lines to add from opponent
+        self.pending_garbage: deque = deque()  # Lines to add from opponent
+        # Bumped whenever placed blocks, stats or previews change; the
+        # renderer keys its static-layer cache on this counter
+        self.state_version: int = 0
         
+    def _refresh_active(self) -> None:
+        """Cache the per-tick guard: a live piece, not paused, not game over"""
+        self._active = (self._current_piece is not None
+                        and not self._paused and not self._game_over)
+
+    @property
+    def current_piece(self) -> Optional[Piece]:
+        return self._current_piece
+
+    @current_piece.setter
+    def current_piece(self, piece: Optional[Piece]) -> None:
+        self._current_piece = piece
+        self._refresh_active()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    @paused.setter
+    def paused(self, value: bool) -> None:
+        self._paused = value
+        self._refresh_active()
+
+    @property
+    def game_over(self) -> bool:
+        return self._game_over
+
+    @game_over.setter
+    def game_over(self, value: bool) -> None:
+        self._game_over = value
+        self._refresh_active()
+
     def toggle_pause(self) -> None:
         """Toggle pause state"""
         if not self.game_over:
@@ -30,7 +98,7 @@ class Board:
     
     def hold_piece(self) -> bool:
         """Hold current piece and swap with held piece"""
-        if not self.can_hold or not self.current_piece or self.paused or self.game_over:
+        if not self.can_hold or not self._active:
             return False
             
         if self.held_piece is None:
@@ -62,6 +130,7 @@ class Board:
                 self.game_over = True
         
         self.can_hold = False
+        self.state_version += 1
         return True
     
     def spawn_piece(self) -> None:
@@ -72,6 +141,9 @@ class Board:
         self.current_piece = self.next_piece
         self.next_piece = Piece()
         self.can_hold = True  # Reset hold ability
+        # Locked blocks, score updates and the next-piece preview all funnel
+        # through here (lock_piece ends in spawn_piece), so one bump suffices
+        self.state_version += 1
         
         # Add pending garbage lines
         self.add_garbage_lines()
@@ -82,45 +154,93 @@ class Board:
     
     def is_collision(self, piece: Piece) -> bool:
         """Check if piece collides with board boundaries or placed blocks"""
-        for block_x, block_y in piece.get_blocks():
-            # Check boundaries
-            if (block_x < 0 or block_x >= self.width or 
-                block_y >= self.height or
-                (block_y >= 0 and self.grid[block_y][block_x] > 0)):
-                return True
-        return False
+        return self.is_collision_at(piece.type, piece.rotation, piece.x, piece.y)
+
+    def is_collision_at(self, piece_type: int, rotation: int, x: int, y: int) -> bool:
+        """Collision test for a piece described by type/rotation/position only"""
+        masks: np.ndarray = _board_kernels.ROW_MASKS_NP[piece_type][rotation]
+        max_row: int = MAX_ROWS[piece_type][rotation]
+        if self._collides_fast is not None:
+            return bool(self._collides_fast(self.occ, masks, max_row, x, y))
+        return bool(_board_kernels.collides(self.occ, masks, max_row,
+                                            x, y, self.height, self.full_row_mask))
+
+    def set_cell(self, x: int, y: int, color: int) -> None:
+        """Set a single cell's color, occupancy bit and column height"""
+        self.grid[y][x] = color
+        if color > 0:
+            self.occ[y] |= 1 << x
+            if y < self.heights[x]:
+                self.heights[x] = y
+        else:
+            self.occ[y] &= ~(1 << x)
+            if self.heights[x] == y:
+                self._recompute_height(x)
+        self.state_version += 1
+
+    def fill_row(self, y: int, color: int = 1) -> None:
+        """Fill a whole row in one slice assignment instead of per-cell writes"""
+        self.grid[y][:] = array('H', (color,)) * self.width
+        self.occ[y] = self.full_row_mask
+        for x in range(self.width):
+            if y < self.heights[x]:
+                self.heights[x] = y
+        self.state_version += 1
+
+    def _recompute_height(self, x: int) -> None:
+        """Rescan one column for its topmost filled cell"""
+        bit: int = 1 << x
+        for y in range(self.height):
+            if self.occ[y] & bit:
+                self.heights[x] = y
+                return
+        self.heights[x] = self.height
+
+    def _drop_distance(self, piece: Piece) -> int:
+        """Distance the piece can fall, derived from cached column heights"""
+        drop: int = self.height
+        for j, bottom in BOTTOM_PER_COL[piece.type][piece.rotation]:
+            distance: int = self.heights[piece.x + j] - (piece.y + bottom) - 1
+            if distance < drop:
+                drop = distance
+        if drop < 0:
+            # Piece sits below a column top (tucked under an overhang) —
+            # fall back to stepwise descent
+            drop = 0
+            while self.is_valid_move(piece, 0, drop + 1):
+                drop += 1
+        return drop
     
     def is_valid_move(self, piece: Piece, dx: int = 0, dy: int = 0) -> bool:
         """Check if moving piece by dx, dy is valid"""
-        test_piece: Piece = piece.copy()
-        test_piece.move(dx, dy)
-        return not self.is_collision(test_piece)
-    
+        return not self.is_collision_at(piece.type, piece.rotation,
+                                        piece.x + dx, piece.y + dy)
+
     def is_valid_rotation(self, piece: Piece) -> bool:
         """Check if rotating piece is valid"""
-        test_piece: Piece = piece.copy()
-        test_piece.rotate_counterclockwise()
-        return not self.is_collision(test_piece)
+        rotations: int = len(piece.SHAPES[piece.type])
+        return not self.is_collision_at(piece.type, (piece.rotation - 1) % rotations,
+                                        piece.x, piece.y)
     
     def move_piece(self, dx: int, dy: int) -> bool:
         """Move current piece if valid"""
-        if self.current_piece and not self.paused and not self.game_over and self.is_valid_move(self.current_piece, dx, dy):
+        if self._active and self.is_valid_move(self.current_piece, dx, dy):
             self.current_piece.move(dx, dy)
             return True
         return False
     
     def rotate_piece(self) -> bool:
         """Rotate current piece if valid"""
-        if self.current_piece and not self.paused and not self.game_over and self.is_valid_rotation(self.current_piece):
+        if self._active and self.is_valid_rotation(self.current_piece):
             self.current_piece.rotate_counterclockwise()
             return True
         return False
     
     def drop_piece(self) -> bool:
         """Move piece down one row, lock if it can't move"""
-        if not self.current_piece or self.paused or self.game_over:
+        if not self._active:
             return False
-            
+
         if self.is_valid_move(self.current_piece, 0, 1):
             self.current_piece.move(0, 1)
             return True
@@ -130,14 +250,13 @@ class Board:
     
     def hard_drop(self) -> None:
         """Drop piece to the bottom instantly"""
-        if not self.current_piece or self.paused or self.game_over:
+        if not self._active:
             return
-            
-        drop_distance: int = 0
-        while self.is_valid_move(self.current_piece, 0, 1):
-            self.current_piece.move(0, 1)
-            drop_distance += 1
-        
+
+        drop_distance: int = self._drop_distance(self.current_piece)
+        if drop_distance > 0:
+            self.current_piece.move(0, drop_distance)
+
         # Award points for hard drop (2 points per cell)
         self.score += drop_distance * 2
         self.lock_piece()
@@ -151,6 +270,9 @@ class Board:
         for block_x, block_y in self.current_piece.get_blocks():
             if 0 <= block_y < self.height and 0 <= block_x < self.width:
                 self.grid[block_y][block_x] = self.current_piece.color
+                self.occ[block_y] |= 1 << block_x
+                if block_y < self.heights[block_x]:
+                    self.heights[block_x] = block_y
         
         # Clear completed lines
         lines_cleared: int = self.clear_lines()
@@ -158,15 +280,15 @@ class Board:
         # Update score and level
         if lines_cleared > 0:
             self.lines_cleared += lines_cleared
-            # Enhanced scoring system based on modern Tetris guidelines
-            line_scores: Dict[int, int] = {1: 100, 2: 300, 3: 500, 4: 800}
-            base_score: int = line_scores.get(lines_cleared, lines_cleared * 100)
+            base_score: int = (_LINE_SCORES[lines_cleared] if lines_cleared < len(_LINE_SCORES)
+                               else lines_cleared * 100)
             self.score += base_score * self.level
             
             # Level progression: every 10 lines cleared
             new_level: int = min(15, (self.lines_cleared // 10) + 1)  # Cap at level 15
             if new_level > self.level:
                 self.level = new_level
+                self.drop_interval_ms = self.get_drop_speed() * 10
                 
             # Send garbage in competitive mode (not implemented in single player)
             if hasattr(self, 'opponent') and self.opponent:
@@ -177,35 +299,57 @@ class Board:
     
     def clear_lines(self) -> int:
         """Clear completed lines and return number cleared"""
-        lines_to_clear: List[int] = []
-        
-        # Find completed lines
-        for y in range(self.height):
-            if all(self.grid[y][x] > 0 for x in range(self.width)):
-                lines_to_clear.append(y)
-        
-        # Remove completed lines (process from bottom to top to maintain indices)
-        for y in reversed(lines_to_clear):
-            del self.grid[y]
-        
-        # Add new empty lines at the top
-        for _ in range(len(lines_to_clear)):
-            self.grid.insert(0, [0] * self.width)
-        
-        return len(lines_to_clear)
+        # Fast path: most locks clear nothing, and the containment test is a
+        # single C-level scan over the occupancy rows
+        if self.full_row_mask not in self.occ:
+            return 0
+
+        # The kernel compacts the occupancy rows and reports which were full
+        cleared_mask: int = int(_board_kernels.clear_full_rows(self.occ, self.full_row_mask))
+        if not cleared_mask:
+            return 0
+
+        cleared: int = cleared_mask.bit_count()
+
+        # Mirror the compaction on the color grid with one downward sweep,
+        # recycling the cleared rows as the new empty rows at the top
+        grid: List[array] = self.grid
+        recycled: List[array] = [grid[y] for y in range(self.height)
+                                 if cleared_mask >> y & 1]
+        write: int = self.height - 1
+        for r in range(self.height - 1, -1, -1):
+            if not cleared_mask >> r & 1:
+                grid[write] = grid[r]
+                write -= 1
+        for i, row in enumerate(recycled):
+            row[:] = self._zero_row  # C-level memset, no new allocation
+            grid[i] = row
+
+        for x in range(self.width):
+            self._recompute_height(x)
+
+        return cleared
     
     def add_garbage_lines(self) -> None:
         """Add garbage lines from opponent"""
+        # Runs on every spawn; bail before the height rescan when there is
+        # no garbage to apply (the common case outside competitive play)
+        if not self.pending_garbage:
+            return
         while self.pending_garbage:
             # Add gray garbage line with one random hole
-            hole_position: int = self.pending_garbage.pop(0)
-            garbage_line: List[int] = [8] * self.width  # 8 = gray garbage color
+            hole_position: int = self.pending_garbage.popleft()
+            garbage_line: array = array('H', [8] * self.width)  # 8 = gray garbage color
             garbage_line[hole_position] = 0
-            
+
             # Remove top line and add garbage at bottom
             if len(self.grid) > 0:
                 self.grid.pop(0)
+                self.occ[:-1] = self.occ[1:]
             self.grid.append(garbage_line)
+            self.occ[-1] = self.full_row_mask ^ (1 << hole_position)
+        for x in range(self.width):
+            self._recompute_height(x)
     
     def send_garbage_to_opponent(self, lines_cleared: int, opponent_board: 'Board') -> None:
         """Send garbage lines to opponent based on lines cleared"""
@@ -213,20 +357,14 @@ class Board:
             return  # No garbage for single lines
         
         garbage_count: int = lines_cleared - 1
-        for _ in range(garbage_count):
-            hole_position: int = __import__('random').randint(0, self.width - 1)
-            opponent_board.pending_garbage.append(hole_position)
-        
+        opponent_board.pending_garbage.extend(
+            randrange(self.width) for _ in range(garbage_count))
+
         self.lines_sent += garbage_count
     
     def get_drop_speed(self) -> int:
         """Get current drop speed based on level (returns frames between drops)"""
-        # Modern Tetris speed curve - faster progression
-        speed_table: Dict[int, int] = {
-            1: 48, 2: 43, 3: 38, 4: 33, 5: 28, 6: 23, 7: 18, 8: 13, 9: 8, 10: 6,
-            11: 5, 12: 4, 13: 3, 14: 2, 15: 1
-        }
-        return speed_table.get(self.level, 1)
+        return _SPEED_TABLE[self.level if self.level <= 15 else 15]
     
     def get_ghost_piece(self) -> Optional[Piece]:
         """Get ghost piece position (where current piece would land)"""
@@ -234,9 +372,10 @@ class Board:
             return None
             
         ghost_piece: Piece = self.current_piece.copy()
-        while self.is_valid_move(ghost_piece, 0, 1):
-            ghost_piece.move(0, 1)
-        
+        drop: int = self._drop_distance(ghost_piece)
+        if drop > 0:
+            ghost_piece.move(0, drop)
+
         return ghost_piece
     
     def get_held_piece_preview(self) -> Optional[Piece]:
@@ -245,7 +384,9 @@ class Board:
     
     def reset(self) -> None:
         """Reset board to initial state"""
-        self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self.grid = [array('H', self._zero_row) for _ in range(self.height)]
+        self.occ = np.zeros(self.height, dtype=np.int64)
+        self.heights = [self.height for _ in range(self.width)]
         self.current_piece = None
         self.next_piece = None
         self.held_piece = None
@@ -253,10 +394,12 @@ class Board:
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
+        self.drop_interval_ms = _SPEED_TABLE[1] * 10
         self.game_over = False
         self.paused = False
         self.lines_sent = 0
-        self.pending_garbage = []
+        self.pending_garbage = deque()
+        self.state_version += 1  # Keep the counter monotonic across resets
         self.spawn_piece()
     
     def get_stats(self) -> Dict[str, int]:
@@ -1,21 +1,32 @@
 import pygame
 import os
 import sys
-from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Tuple, Optional
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.board import Board
 from src.ui import TetrisRenderer
 
-class GameState(Enum):
-    MENU = "menu"
-    SINGLE_PLAYER = "single"
-    MULTIPLAYER = "multiplayer"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
+# Event subsets drained per state; a typed event.get() skips everything else
+_GAMEPLAY_EVENTS: Tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+_MENU_EVENTS: Tuple[int, ...] = (pygame.QUIT, pygame.MOUSEBUTTONDOWN)
+_PAUSE_EVENTS: Tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+class GameState(IntEnum):
+    """Game states as an IntEnum so the per-frame comparisons in run()
+    are plain C integer compares instead of Enum.__eq__ calls"""
+    MENU = 0
+    SINGLE_PLAYER = 1
+    MULTIPLAYER = 2
+    PAUSED = 3
+    GAME_OVER = 4
 
 class MenuButton:
+    # Fixed attribute set: no per-instance __dict__, faster attribute loads
+    __slots__ = ('rect', 'text', 'color', 'hover_color', 'is_hovered',
+                 'hover_changed', '_text_surf', '_text_rect')
+
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  color: Tuple[int, int, int] = (100, 200, 255), 
                  hover_color: Tuple[int, int, int] = (120, 220, 255)) -> None:
@@ -24,23 +35,26 @@ class MenuButton:
         self.color: Tuple[int, int, int] = color
         self.hover_color: Tuple[int, int, int] = hover_color
         self.is_hovered: bool = False
-        
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered:
-                return True
-        return False
-    
+        self.hover_changed: bool = False  # Set when is_hovered flipped this frame
+        # Label surface rendered once on first draw
+        self._text_surf: Optional[pygame.Surface] = None
+        self._text_rect: Optional[pygame.Rect] = None
+
+    def update_hover(self, mouse_pos: Tuple[int, int]) -> None:
+        """Refresh hover state from the polled mouse position"""
+        hovered: bool = bool(self.rect.collidepoint(mouse_pos))
+        self.hover_changed |= hovered != self.is_hovered
+        self.is_hovered = hovered
+
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
         color: Tuple[int, int, int] = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), self.rect, 3, border_radius=10)
         
-        text_surf: pygame.Surface = font.render(self.text, True, (255, 255, 255))
-        text_rect: pygame.Rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        if self._text_surf is None:
+            self._text_surf = font.render(self.text, True, (255, 255, 255))
+            self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+        surface.blit(self._text_surf, self._text_rect)
 
 class TetrisGame:
     """Professional Tetris game with single and multiplayer modes"""
@@ -59,6 +73,9 @@ class TetrisGame:
         self.state: GameState = GameState.MENU
         self.previous_game_mode: Optional[GameState] = None  # Track the last played game mode
         self.running: bool = True
+        self._now: int = 0  # Frame timestamp, read once per loop iteration
+        self._dirty: bool = True  # Render only when something on screen changed
+        self._dirty_rects: List[pygame.Rect] = []  # Hover-only changes to patch
         
         # Initialize game components
         self.board1: Board = Board(player_id=1)  # Player 1
@@ -82,6 +99,38 @@ class TetrisGame:
         }
         self.key_repeat_delay: int = 150
         self.key_repeat_rate: int = 50
+
+        # O(1) key dispatch tables replacing the per-event if/elif chains
+        self._p1_actions: Dict[int, Any] = {
+            pygame.K_UP: self.board1.rotate_piece,
+            pygame.K_SPACE: self.board1.hard_drop,
+            pygame.K_c: self.board1.hold_piece,
+        }
+        self._p2_actions: Dict[int, Any] = {
+            pygame.K_w: self.board2.rotate_piece,
+            pygame.K_q: self.board2.hard_drop,
+            pygame.K_e: self.board2.hold_piece,
+        }
+        # key -> (keys_pressed flag, horizontal direction; 0 = soft drop)
+        self._p1_moves: Dict[int, Tuple[str, int]] = {
+            pygame.K_DOWN: ('p1_down', 0),
+            pygame.K_LEFT: ('p1_left', -1),
+            pygame.K_RIGHT: ('p1_right', 1),
+        }
+        self._p2_moves: Dict[int, Tuple[str, int]] = {
+            pygame.K_s: ('p2_down', 0),
+            pygame.K_a: ('p2_left', -1),
+            pygame.K_d: ('p2_right', 1),
+        }
+        self._keyup_flags: Dict[int, str] = {
+            pygame.K_DOWN: 'p1_down', pygame.K_LEFT: 'p1_left', pygame.K_RIGHT: 'p1_right',
+            pygame.K_s: 'p2_down', pygame.K_a: 'p2_left', pygame.K_d: 'p2_right',
+        }
+        # Autorepeat entries: (board, keys_pressed flag, horizontal direction)
+        self._p1_repeat: Tuple[Tuple[Board, str, int], ...] = (
+            (self.board1, 'p1_left', -1), (self.board1, 'p1_right', 1))
+        self._all_repeat: Tuple[Tuple[Board, str, int], ...] = self._p1_repeat + (
+            (self.board2, 'p2_left', -1), (self.board2, 'p2_right', 1))
         
         # Menu setup
         self.setup_menu()
@@ -90,7 +139,25 @@ class TetrisGame:
         self.title_font: pygame.font.Font = pygame.font.Font(None, 72)
         self.button_font: pygame.font.Font = pygame.font.Font(None, 36)
         self.small_font: pygame.font.Font = pygame.font.Font(None, 24)
-        
+
+        # Static headings pre-rendered once instead of per frame
+        self._title_surf: pygame.Surface = self.title_font.render("TETRIS GAME", True, (100, 200, 255))
+        self._title_rect: pygame.Rect = self._title_surf.get_rect(center=(self.width // 2, 150))
+        self._subtitle_surf: pygame.Surface = self.small_font.render("Competitive Block Puzzle Game", True, (180, 180, 200))
+        self._subtitle_rect: pygame.Rect = self._subtitle_surf.get_rect(center=(self.width // 2, 200))
+        self._paused_surf: pygame.Surface = self.title_font.render("PAUSED", True, (255, 255, 255))
+        self._paused_rect: pygame.Rect = self._paused_surf.get_rect(center=(self.width // 2, 200))
+        self._game_over_surf: pygame.Surface = self.title_font.render("GAME OVER", True, (255, 89, 94))
+        self._game_over_rect: pygame.Rect = self._game_over_surf.get_rect(center=(self.width // 2, 120))
+
+        # Shared semi-transparent overlay for pause and game-over screens
+        self._overlay: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 128))
+
+        # Game-over stat lines rendered once per result, not per frame
+        self._game_over_key: Optional[Tuple] = None
+        self._game_over_lines: List[Tuple[pygame.Surface, pygame.Rect]] = []
+
     def setup_menu(self) -> None:
         """Setup menu buttons"""
         button_width: int = 300
@@ -117,27 +184,74 @@ class TetrisGame:
             MenuButton(button_x, start_y + spacing, button_width, button_height, "Play Again"),
             MenuButton(button_x, start_y + spacing * 2, button_width, button_height, "Main Menu")
         ]
+
+        # Button rect lists so click hit-testing is one collidelist call
+        self._menu_rects: List[pygame.Rect] = [b.rect for b in self.menu_buttons]
+        self._pause_rects: List[pygame.Rect] = [b.rect for b in self.pause_buttons]
+        self._game_over_rects: List[pygame.Rect] = [b.rect for b in self.game_over_buttons]
+
+        # Menu background gradient drawn once; draw_menu just blits it
+        self._menu_bg: pygame.Surface = pygame.Surface((self.width, self.height))
+        for y in range(self.height):
+            color_intensity: int = int(15 + (y / self.height) * 20)
+            pygame.draw.line(self._menu_bg, (color_intensity, color_intensity, color_intensity + 10),
+                           (0, y), (self.width, y))
     
+    def _apply_event_filter(self) -> None:
+        """Allow only the event types the current state's handler drains.
+
+        Everything else (MOUSEMOTION, TEXTINPUT, window/focus noise) is
+        dropped at the SDL layer instead of piling up toward the event
+        queue's 65535-entry cap, after which new events — including QUIT
+        and KEYDOWN — would be silently discarded. Menu hover is polled
+        once per frame from pygame.mouse.get_pos() instead of being driven
+        at pointer-device event rate.
+        """
+        pygame.event.set_blocked(None)  # block everything, then re-allow
+        if self.state in (GameState.SINGLE_PLAYER, GameState.MULTIPLAYER):
+            pygame.event.set_allowed(_GAMEPLAY_EVENTS)
+        elif self.state == GameState.PAUSED:
+            pygame.event.set_allowed(_PAUSE_EVENTS)
+        else:  # MENU / GAME_OVER
+            pygame.event.set_allowed(_MENU_EVENTS)
+
+    def _collect_hover_rects(self, buttons: List[MenuButton]) -> None:
+        """Queue partial screen updates for buttons whose hover state flipped"""
+        for button in buttons:
+            if button.hover_changed:
+                self._dirty_rects.append(button.rect)
+                button.hover_changed = False
+
+    def _poll_hover(self, buttons: List[MenuButton]) -> None:
+        """Update hover for a button set from one mouse position poll"""
+        mouse_pos: Tuple[int, int] = pygame.mouse.get_pos()
+        for button in buttons:
+            button.update_hover(mouse_pos)
+
     def handle_menu_input(self) -> bool:
         """Handle menu input"""
-        for event in pygame.event.get():
+        self._poll_hover(self.menu_buttons)
+        for event in pygame.event.get(_MENU_EVENTS):
             if event.type == pygame.QUIT:
                 return False
-            
-            # Handle button clicks
-            for i, button in enumerate(self.menu_buttons):
-                if button.handle_event(event):
-                    if i == 0:  # Single Player
-                        self.start_single_player()
-                    elif i == 1:  # Multiplayer
-                        self.start_multiplayer()
-                    elif i == 2:  # Quit
-                        return False
+            self._dirty = True  # Click feedback needs a full redraw
+
+            # Only MOUSEBUTTONDOWN remains: one C-level hit test over all rects
+            hit: int = pygame.Rect(event.pos, (1, 1)).collidelist(self._menu_rects)
+            if hit == 0:    # Single Player
+                self.start_single_player()
+            elif hit == 1:  # Multiplayer
+                self.start_multiplayer()
+            elif hit == 2:  # Quit
+                return False
+        self._collect_hover_rects(self.menu_buttons)
         return True
     
     def handle_pause_input(self) -> bool:
         """Handle pause menu input"""
-        for event in pygame.event.get():
+        self._poll_hover(self.pause_buttons)
+        for event in pygame.event.get(_PAUSE_EVENTS):
+            self._dirty = True
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -150,43 +264,74 @@ class TetrisGame:
                     if self.previous_game_mode == GameState.MULTIPLAYER:
                         self.board2.toggle_pause()
             
-            # Handle button clicks
-            for i, button in enumerate(self.pause_buttons):
-                if button.handle_event(event):
-                    if i == 0:  # Resume
-                        if self.previous_game_mode == GameState.MULTIPLAYER:
-                            self.state = GameState.MULTIPLAYER
-                        else:
-                            self.state = GameState.SINGLE_PLAYER
-                        self.board1.toggle_pause()
-                        if self.previous_game_mode == GameState.MULTIPLAYER:
-                            self.board2.toggle_pause()
-                    elif i == 1:  # Restart
-                        self.restart_game()
-                    elif i == 2:  # Main Menu
-                        self.state = GameState.MENU
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                hit: int = pygame.Rect(event.pos, (1, 1)).collidelist(self._pause_rects)
+                if hit == 0:    # Resume
+                    if self.previous_game_mode == GameState.MULTIPLAYER:
+                        self.state = GameState.MULTIPLAYER
+                    else:
+                        self.state = GameState.SINGLE_PLAYER
+                    self.board1.toggle_pause()
+                    if self.previous_game_mode == GameState.MULTIPLAYER:
+                        self.board2.toggle_pause()
+                elif hit == 1:  # Restart
+                    self.restart_game()
+                elif hit == 2:  # Main Menu
+                    self.state = GameState.MENU
+        self._collect_hover_rects(self.pause_buttons)
         return True
     
     def handle_game_over_input(self) -> bool:
         """Handle game over input"""
-        for event in pygame.event.get():
+        self._poll_hover(self.game_over_buttons)
+        for event in pygame.event.get(_MENU_EVENTS):
             if event.type == pygame.QUIT:
                 return False
-            
-            # Handle button clicks
-            for i, button in enumerate(self.game_over_buttons):
-                if button.handle_event(event):
-                    if i == 0:  # Play Again
-                        self.restart_game()
-                    elif i == 1:  # Main Menu
-                        self.state = GameState.MENU
+            self._dirty = True
+
+            hit: int = pygame.Rect(event.pos, (1, 1)).collidelist(self._game_over_rects)
+            if hit == 0:    # Play Again
+                self.restart_game()
+            elif hit == 1:  # Main Menu
+                self.state = GameState.MENU
+        self._collect_hover_rects(self.game_over_buttons)
         return True
     
+    def _dispatch_keydown(self, key: int, actions: Dict[int, Any],
+                          moves: Dict[int, Tuple[str, int]], board: Board,
+                          current_time: int) -> bool:
+        """Look up and run one player's action for a key; True if handled"""
+        action = actions.get(key)
+        if action is not None:
+            action()
+            self._dirty = True
+            return True
+        move = moves.get(key)
+        if move is not None:
+            flag, dx = move
+            self.keys_pressed[flag] = True
+            if dx:
+                self.key_repeat_timers[flag] = current_time + self.key_repeat_delay
+                if board.move_piece(dx, 0):
+                    self._dirty = True
+            return True
+        return False
+
+    def _process_autorepeat(self, table: Tuple[Tuple[Board, str, int], ...],
+                            current_time: int) -> None:
+        """Apply held-key horizontal movement for every entry that is due"""
+        for board, flag, dx in table:
+            if (self.keys_pressed[flag] and not board.game_over and not board.paused
+                    and current_time >= self.key_repeat_timers[flag]):
+                if board.move_piece(dx, 0):
+                    self._dirty = True
+                self.key_repeat_timers[flag] = current_time + self.key_repeat_rate
+
     def handle_single_player_input(self) -> bool:
         """Handle single player input"""
-        current_time: int = pygame.time.get_ticks()
-        
-        for event in pygame.event.get():
+        current_time: int = self._now
+
+        for event in pygame.event.get(_GAMEPLAY_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -195,46 +340,24 @@ class TetrisGame:
                 elif event.key == pygame.K_p:
                     self.state = GameState.PAUSED
                     self.board1.toggle_pause()
-                elif event.key == pygame.K_UP:
-                    self.board1.rotate_piece()
-                elif event.key == pygame.K_SPACE:
-                    self.board1.hard_drop()
-                elif event.key == pygame.K_c:  # Hold piece
-                    self.board1.hold_piece()
-                elif event.key == pygame.K_DOWN:
-                    self.keys_pressed['p1_down'] = True
-                elif event.key == pygame.K_LEFT:
-                    self.keys_pressed['p1_left'] = True
-                    self.key_repeat_timers['p1_left'] = current_time + self.key_repeat_delay
-                    self.board1.move_piece(-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['p1_right'] = True
-                    self.key_repeat_timers['p1_right'] = current_time + self.key_repeat_delay
-                    self.board1.move_piece(1, 0)
+                else:
+                    self._dispatch_keydown(event.key, self._p1_actions,
+                                           self._p1_moves, self.board1, current_time)
             elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_DOWN:
-                    self.keys_pressed['p1_down'] = False
-                elif event.key == pygame.K_LEFT:
-                    self.keys_pressed['p1_left'] = False
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['p1_right'] = False
-        
+                flag: Optional[str] = self._keyup_flags.get(event.key)
+                if flag is not None:
+                    self.keys_pressed[flag] = False
+
         # Handle held keys
-        if not self.board1.game_over and not self.board1.paused:
-            for direction in ['p1_left', 'p1_right']:
-                if (self.keys_pressed[direction] and 
-                    current_time >= self.key_repeat_timers[direction]):
-                    dx: int = -1 if 'left' in direction else 1
-                    self.board1.move_piece(dx, 0)
-                    self.key_repeat_timers[direction] = current_time + self.key_repeat_rate
-        
+        self._process_autorepeat(self._p1_repeat, current_time)
+
         return True
-    
+
     def handle_multiplayer_input(self) -> bool:
         """Handle multiplayer input"""
-        current_time: int = pygame.time.get_ticks()
-        
-        for event in pygame.event.get():
+        current_time: int = self._now
+
+        for event in pygame.event.get(_GAMEPLAY_EVENTS):
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -244,76 +367,20 @@ class TetrisGame:
                     self.state = GameState.PAUSED
                     self.board1.toggle_pause()
                     self.board2.toggle_pause()
-                
-                # Player 1 controls (Arrow keys)
-                elif event.key == pygame.K_UP:
-                    self.board1.rotate_piece()
-                elif event.key == pygame.K_SPACE:
-                    self.board1.hard_drop()
-                elif event.key == pygame.K_c:  # Fixed: Use C for Player 1 hold in multiplayer
-                    self.board1.hold_piece()
-                elif event.key == pygame.K_DOWN:
-                    self.keys_pressed['p1_down'] = True
-                elif event.key == pygame.K_LEFT:
-                    self.keys_pressed['p1_left'] = True
-                    self.key_repeat_timers['p1_left'] = current_time + self.key_repeat_delay
-                    self.board1.move_piece(-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['p1_right'] = True
-                    self.key_repeat_timers['p1_right'] = current_time + self.key_repeat_delay
-                    self.board1.move_piece(1, 0)
-                
-                # Player 2 controls (WASD)
-                elif event.key == pygame.K_w:
-                    self.board2.rotate_piece()
-                elif event.key == pygame.K_q:  # Q for hard drop
-                    self.board2.hard_drop()
-                elif event.key == pygame.K_e:  # Fixed: Use E for Player 2 hold
-                    self.board2.hold_piece()
-                elif event.key == pygame.K_s:
-                    self.keys_pressed['p2_down'] = True
-                elif event.key == pygame.K_a:
-                    self.keys_pressed['p2_left'] = True
-                    self.key_repeat_timers['p2_left'] = current_time + self.key_repeat_delay
-                    self.board2.move_piece(-1, 0)
-                elif event.key == pygame.K_d:
-                    self.keys_pressed['p2_right'] = True
-                    self.key_repeat_timers['p2_right'] = current_time + self.key_repeat_delay
-                    self.board2.move_piece(1, 0)
-                    
+                # Player 1 (arrow keys), then Player 2 (WASD)
+                elif not self._dispatch_keydown(event.key, self._p1_actions,
+                                                self._p1_moves, self.board1, current_time):
+                    self._dispatch_keydown(event.key, self._p2_actions,
+                                           self._p2_moves, self.board2, current_time)
+
             elif event.type == pygame.KEYUP:
-                # Player 1
-                if event.key == pygame.K_DOWN:
-                    self.keys_pressed['p1_down'] = False
-                elif event.key == pygame.K_LEFT:
-                    self.keys_pressed['p1_left'] = False
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['p1_right'] = False
-                # Player 2
-                elif event.key == pygame.K_s:
-                    self.keys_pressed['p2_down'] = False
-                elif event.key == pygame.K_a:
-                    self.keys_pressed['p2_left'] = False
-                elif event.key == pygame.K_d:
-                    self.keys_pressed['p2_right'] = False
-        
+                flag: Optional[str] = self._keyup_flags.get(event.key)
+                if flag is not None:
+                    self.keys_pressed[flag] = False
+
         # Handle held keys for both players
-        if not self.board1.game_over and not self.board1.paused:
-            for direction in ['p1_left', 'p1_right']:
-                if (self.keys_pressed[direction] and 
-                    current_time >= self.key_repeat_timers[direction]):
-                    dx: int = -1 if 'left' in direction else 1
-                    self.board1.move_piece(dx, 0)
-                    self.key_repeat_timers[direction] = current_time + self.key_repeat_rate
-        
-        if not self.board2.game_over and not self.board2.paused:
-            for direction in ['p2_left', 'p2_right']:
-                if (self.keys_pressed[direction] and 
-                    current_time >= self.key_repeat_timers[direction]):
-                    dx: int = -1 if 'left' in direction else 1
-                    self.board2.move_piece(dx, 0)
-                    self.key_repeat_timers[direction] = current_time + self.key_repeat_rate
-        
+        self._process_autorepeat(self._all_repeat, current_time)
+
         return True
     
     def update_single_player(self) -> None:
@@ -323,8 +390,8 @@ class TetrisGame:
             return
             
         if not self.board1.paused:
-            current_time: int = pygame.time.get_ticks()
-            drop_speed: int = self.board1.get_drop_speed() * 10  # Convert to milliseconds
+            current_time: int = self._now
+            drop_speed: int = self.board1.drop_interval_ms
             
             if self.keys_pressed['p1_down']:
                 drop_speed = min(drop_speed, 50)
@@ -332,43 +399,53 @@ class TetrisGame:
             if current_time - self.drop_time1 >= drop_speed:
                 self.board1.drop_piece()
                 self.drop_time1 = current_time
-    
+                self._dirty = True
+
     def update_multiplayer(self) -> None:
         """Update multiplayer game logic"""
-        current_time: int = pygame.time.get_ticks()
+        current_time: int = self._now
         
         # Update player 1
         if not self.board1.game_over and not self.board1.paused:
-            drop_speed1: int = self.board1.get_drop_speed() * 10
+            drop_speed1: int = self.board1.drop_interval_ms
             if self.keys_pressed['p1_down']:
                 drop_speed1 = min(drop_speed1, 50)
             
             if current_time - self.drop_time1 >= drop_speed1:
                 self.board1.drop_piece()
                 self.drop_time1 = current_time
+                self._dirty = True
         
         # Update player 2
         if not self.board2.game_over and not self.board2.paused:
-            drop_speed2: int = self.board2.get_drop_speed() * 10
+            drop_speed2: int = self.board2.drop_interval_ms
             if self.keys_pressed['p2_down']:
                 drop_speed2 = min(drop_speed2, 50)
             
             if current_time - self.drop_time2 >= drop_speed2:
                 self.board2.drop_piece()
                 self.drop_time2 = current_time
+                self._dirty = True
         
         # Check for game over
         if self.board1.game_over or self.board2.game_over:
             self.state = GameState.GAME_OVER
     
+    def _reset_input_state(self) -> None:
+        """Clear held-key flags and repeat timers in place, keeping the dicts"""
+        for key in self.keys_pressed:
+            self.keys_pressed[key] = False
+        for key in self.key_repeat_timers:
+            self.key_repeat_timers[key] = 0
+
     def start_single_player(self) -> None:
         """Start single player mode"""
         self.state = GameState.SINGLE_PLAYER
         self.previous_game_mode = GameState.SINGLE_PLAYER  # Track the game mode
         self.board1.reset()
         self.drop_time1 = 0
-        self.keys_pressed = {key: False for key in self.keys_pressed}
-    
+        self._reset_input_state()
+
     def start_multiplayer(self) -> None:
         """Start multiplayer mode"""
         self.state = GameState.MULTIPLAYER
@@ -377,7 +454,7 @@ class TetrisGame:
         self.board2.reset()
         self.drop_time1 = 0
         self.drop_time2 = 0
-        self.keys_pressed = {key: False for key in self.keys_pressed}
+        self._reset_input_state()
     
     def restart_game(self) -> None:
         """Restart current game mode"""
@@ -389,21 +466,12 @@ class TetrisGame:
     
     def draw_menu(self) -> None:
         """Draw main menu"""
-        # Background gradient
-        for y in range(self.height):
-            color_intensity: int = int(15 + (y / self.height) * 20)
-            pygame.draw.line(self.screen, (color_intensity, color_intensity, color_intensity + 10), 
-                           (0, y), (self.width, y))
-        
-        # Title
-        title_text: pygame.Surface = self.title_font.render("TETRIS GAME", True, (100, 200, 255))
-        title_rect: pygame.Rect = title_text.get_rect(center=(self.width // 2, 150))
-        self.screen.blit(title_text, title_rect)
+        # Background gradient (pre-rendered)
+        self.screen.blit(self._menu_bg, (0, 0))
         
-        # Subtitle
-        subtitle_text: pygame.Surface = self.small_font.render("Competitive Block Puzzle Game", True, (180, 180, 200))
-        subtitle_rect: pygame.Rect = subtitle_text.get_rect(center=(self.width // 2, 200))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        # Title and subtitle (pre-rendered)
+        self.screen.blit(self._title_surf, self._title_rect)
+        self.screen.blit(self._subtitle_surf, self._subtitle_rect)
         
         # Draw buttons
         for button in self.menu_buttons:
@@ -411,37 +479,22 @@ class TetrisGame:
     
     def draw_pause_menu(self) -> None:
         """Draw pause overlay"""
-        # Semi-transparent overlay
-        overlay: pygame.Surface = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay (cached)
+        self.screen.blit(self._overlay, (0, 0))
         
-        # Pause text
-        pause_text: pygame.Surface = self.title_font.render("PAUSED", True, (255, 255, 255))
-        pause_rect: pygame.Rect = pause_text.get_rect(center=(self.width // 2, 200))
-        self.screen.blit(pause_text, pause_rect)
+        # Pause text (pre-rendered)
+        self.screen.blit(self._paused_surf, self._paused_rect)
         
         # Draw buttons
         for button in self.pause_buttons:
             button.draw(self.screen, self.button_font)
     
-    def draw_game_over_screen(self) -> None:
-        """Draw game over screen"""
-        # Semi-transparent overlay
-        overlay: pygame.Surface = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text: pygame.Surface = self.title_font.render("GAME OVER", True, (255, 89, 94))
-        game_over_rect: pygame.Rect = game_over_text.get_rect(center=(self.width // 2, 120))
-        self.screen.blit(game_over_text, game_over_rect)
-        
+    def _build_game_over_lines(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render the game-over stat text for the current result"""
+        lines: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        center_x: int = self.width // 2
         current_y: int = 170
-        
-        # Score display
+
         if self.previous_game_mode == GameState.MULTIPLAYER:
             # Winner announcement
             winner_text: pygame.Surface
@@ -451,45 +504,74 @@ class TetrisGame:
                 winner_text = self.button_font.render("Player 1 Wins!", True, (138, 201, 38))
             else:
                 winner_text = self.button_font.render("It's a Tie!", True, (255, 202, 58))
-            winner_rect: pygame.Rect = winner_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(winner_text, winner_rect)
+            lines.append((winner_text, winner_text.get_rect(center=(center_x, current_y))))
             current_y += 40
-            
+
             # Player 1 final scores
             p1_score_text: pygame.Surface = self.small_font.render(f"Player 1 - Score: {self.board1.score:,} | Level: {self.board1.level} | Lines: {self.board1.lines_cleared}", True, (255, 255, 255))
-            p1_score_rect: pygame.Rect = p1_score_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(p1_score_text, p1_score_rect)
+            lines.append((p1_score_text, p1_score_text.get_rect(center=(center_x, current_y))))
             current_y += 25
-            
-            # Player 2 final scores  
+
+            # Player 2 final scores
             p2_score_text: pygame.Surface = self.small_font.render(f"Player 2 - Score: {self.board2.score:,} | Level: {self.board2.level} | Lines: {self.board2.lines_cleared}", True, (255, 255, 255))
-            p2_score_rect: pygame.Rect = p2_score_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(p2_score_text, p2_score_rect)
-            
+            lines.append((p2_score_text, p2_score_text.get_rect(center=(center_x, current_y))))
+
         else:
             # Single player final scores
             final_score_text: pygame.Surface = self.button_font.render(f"Final Score: {self.board1.score:,}", True, (255, 255, 255))
-            score_rect: pygame.Rect = final_score_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(final_score_text, score_rect)
+            lines.append((final_score_text, final_score_text.get_rect(center=(center_x, current_y))))
             current_y += 35
-            
+
             # Additional stats
             level_text: pygame.Surface = self.small_font.render(f"Level Reached: {self.board1.level}", True, (180, 180, 200))
-            level_rect: pygame.Rect = level_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(level_text, level_rect)
+            lines.append((level_text, level_text.get_rect(center=(center_x, current_y))))
             current_y += 20
-            
+
             lines_text: pygame.Surface = self.small_font.render(f"Lines Cleared: {self.board1.lines_cleared}", True, (180, 180, 200))
-            lines_rect: pygame.Rect = lines_text.get_rect(center=(self.width // 2, current_y))
-            self.screen.blit(lines_text, lines_rect)
-        
+            lines.append((lines_text, lines_text.get_rect(center=(center_x, current_y))))
+
+        return lines
+
+    def draw_game_over_screen(self) -> None:
+        """Draw game over screen"""
+        # Semi-transparent overlay (cached)
+        self.screen.blit(self._overlay, (0, 0))
+        
+        # Game over text (pre-rendered)
+        self.screen.blit(self._game_over_surf, self._game_over_rect)
+        
+        # Stats never change once the game is over: render them on the first
+        # frame of each result and blit the cached surfaces afterwards
+        key: Tuple = (self.previous_game_mode, self.board1.game_over, self.board2.game_over,
+                      self.board1.score, self.board1.level, self.board1.lines_cleared,
+                      self.board2.score, self.board2.level, self.board2.lines_cleared)
+        if key != self._game_over_key:
+            self._game_over_key = key
+            self._game_over_lines = self._build_game_over_lines()
+        for surf, rect in self._game_over_lines:
+            self.screen.blit(surf, rect)
+
         # Draw buttons
         for button in self.game_over_buttons:
             button.draw(self.screen, self.button_font)
     
     def run(self) -> None:
         """Main game loop"""
+        filtered_state: Optional[GameState] = None
+        needs_flip: bool = True  # Full flip after state changes; rects otherwise
         while self.running:
+            # Pump SDL once per frame; the handlers then drain the queue
+            pygame.event.pump()
+            # One timestamp per frame so every subsystem sees the same time
+            self._now = pygame.time.get_ticks()
+
+            # Re-apply the per-state event filter when the state changes
+            if self.state != filtered_state:
+                self._apply_event_filter()
+                filtered_state = self.state
+                self._dirty = True
+                needs_flip = True
+
             # Handle input based on current state
             if self.state == GameState.MENU:
                 self.running = self.handle_menu_input()
@@ -504,28 +586,57 @@ class TetrisGame:
                 self.running = self.handle_multiplayer_input()
                 self.update_multiplayer()
             
-            # Render based on current state
-            if self.state == GameState.MENU:
-                self.draw_menu()
-            elif self.state == GameState.SINGLE_PLAYER:
-                self.renderer.render_single_player(self.screen, self.board1)
-            elif self.state == GameState.MULTIPLAYER:
-                self.renderer.render_multiplayer(self.screen, self.board1, self.board2)
-            elif self.state == GameState.PAUSED:
-                if self.previous_game_mode == GameState.MULTIPLAYER:
-                    self.renderer.render_multiplayer(self.screen, self.board1, self.board2)
-                else:
+            # Render based on current state, but only when something changed
+            if self._dirty:
+                update_rects: Optional[List[pygame.Rect]] = None
+                if self.state == GameState.MENU:
+                    self.draw_menu()
+                elif self.state == GameState.SINGLE_PLAYER:
                     self.renderer.render_single_player(self.screen, self.board1)
-                self.draw_pause_menu()
-            elif self.state == GameState.GAME_OVER:
-                if self.previous_game_mode == GameState.MULTIPLAYER:
+                    update_rects = self.renderer.dirty_rects_single
+                elif self.state == GameState.MULTIPLAYER:
                     self.renderer.render_multiplayer(self.screen, self.board1, self.board2)
+                    update_rects = self.renderer.dirty_rects_multi
+                elif self.state == GameState.PAUSED:
+                    if self.previous_game_mode == GameState.MULTIPLAYER:
+                        self.renderer.render_multiplayer(self.screen, self.board1, self.board2)
+                    else:
+                        self.renderer.render_single_player(self.screen, self.board1)
+                    self.draw_pause_menu()
+                elif self.state == GameState.GAME_OVER:
+                    if self.previous_game_mode == GameState.MULTIPLAYER:
+                        self.renderer.render_multiplayer(self.screen, self.board1, self.board2)
+                    else:
+                        self.renderer.render_single_player(self.screen, self.board1)
+                    self.draw_game_over_screen()
+
+                # During play only the boards and panels change; pushing just
+                # those regions skips most of the (memory-bound) flip cost
+                if update_rects is not None and not needs_flip:
+                    pygame.display.update(update_rects)
                 else:
-                    self.renderer.render_single_player(self.screen, self.board1)
-                self.draw_game_over_screen()
-            
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+                    pygame.display.flip()
+                    needs_flip = False
+                self._dirty = False
+                self._dirty_rects.clear()
+            elif self._dirty_rects:
+                # Only button hover changed: repaint those buttons and push
+                # just their rectangles instead of flipping the whole screen
+                if self.state == GameState.MENU:
+                    buttons = self.menu_buttons
+                elif self.state == GameState.PAUSED:
+                    buttons = self.pause_buttons
+                else:
+                    buttons = self.game_over_buttons
+                for button in buttons:
+                    button.draw(self.screen, self.button_font)
+                pygame.display.update(self._dirty_rects)
+                self._dirty_rects.clear()
+            # Static screens don't need the full frame rate; sleep longer
+            if self.state == GameState.PAUSED or self.state == GameState.GAME_OVER:
+                self.clock.tick(30)
+            else:
+                self.clock.tick(self.fps)
         
         pygame.quit()
         sys.exit()
@@ -1,9 +1,19 @@
 import random
 from typing import List, Tuple
 
+import numpy as np
+
+# getrandbits is much lighter than randint's range handling; pieces are
+# spawned on every lock so this path is hot
+_randbits = random.getrandbits
+
 class Piece:
     """Represents a Tetris piece (tetromino)"""
-    
+
+    # Fixed attribute set: pieces are created constantly and their fields are
+    # read in every collision check, so skip the per-instance __dict__
+    __slots__ = ('x', 'y', 'type', 'color', 'rotation', '_blocks', '_blocks_key')
+
     # Tetromino shapes represented as 4x4 grids
     SHAPES: List[List[List[int]]] = [
         [[4, 5, 6, 7], [1, 5, 9, 13]],                              # I-piece (horizontal first)
@@ -19,10 +29,20 @@ class Piece:
         """Initialize a new piece at given position"""
         self.x: int = x
         self.y: int = y
-        self.type: int = random.randint(0, len(self.SHAPES) - 1)
-        self.color: int = random.randint(1, 7)  # Color index (excluding background color)
+        # Draw 3 bits and reject the single out-of-range value (7 types, 7 colors)
+        piece_type: int = _randbits(3)
+        while piece_type == 7:
+            piece_type = _randbits(3)
+        self.type: int = piece_type
+        color: int = _randbits(3)
+        while color == 0:
+            color = _randbits(3)
+        self.color: int = color  # Color index (excluding background color)
         self.rotation: int = 0
-    
+        # get_blocks memo, validated against the state it was built for
+        self._blocks: Tuple[Tuple[int, int], ...] = ()
+        self._blocks_key: Tuple[int, int, int, int] = (-1, -1, -1, -1)
+
     def get_shape(self) -> List[int]:
         """Get current shape based on rotation"""
         return self.SHAPES[self.type][self.rotation]
@@ -42,18 +62,82 @@ class Piece:
     
     def copy(self) -> 'Piece':
         """Create a copy of this piece"""
-        new_piece: Piece = Piece(self.x, self.y)
+        # Bypass __init__ so the copy doesn't burn RNG draws on a type and
+        # color that are overwritten anyway
+        new_piece: Piece = object.__new__(Piece)
+        new_piece.x = self.x
+        new_piece.y = self.y
         new_piece.type = self.type
         new_piece.color = self.color
         new_piece.rotation = self.rotation
+        new_piece._blocks = self._blocks
+        new_piece._blocks_key = self._blocks_key
         return new_piece
     
-    def get_blocks(self) -> List[Tuple[int, int]]:
-        """Get list of (x, y) coordinates for all blocks in this piece"""
-        blocks: List[Tuple[int, int]] = []
-        shape: List[int] = self.get_shape()
-        for i in range(4):
-            for j in range(4):
-                if i * 4 + j in shape:
-                    blocks.append((self.x + j, self.y + i))
-        return blocks
\ No newline at end of file
+    def get_blocks(self) -> Tuple[Tuple[int, int], ...]:
+        """Get the (x, y) coordinates for all blocks in this piece"""
+        key: Tuple[int, int, int, int] = (self.x, self.y, self.type, self.rotation)
+        if key != self._blocks_key:
+            x, y = self.x, self.y
+            self._blocks = tuple((x + dx, y + dy)
+                                 for dx, dy in BLOCK_OFFSETS[self.type][self.rotation])
+            self._blocks_key = key
+        return self._blocks
+
+    def get_blocks_array(self) -> np.ndarray:
+        """Block coordinates as a (4, 2) array for vectorized consumers"""
+        return BLOCK_OFFSETS_NP[self.type, self.rotation] + (self.x, self.y)
+
+
+def _build_shape_tables() -> Tuple[tuple, tuple]:
+    """Precompute block offsets and per-row column bitmasks for every rotation"""
+    offsets_table: List[tuple] = []
+    masks_table: List[tuple] = []
+    for rotations in Piece.SHAPES:
+        piece_offsets: List[Tuple[Tuple[int, int], ...]] = []
+        piece_masks: List[Tuple[int, ...]] = []
+        for shape in rotations:
+            # (dx, dy) offsets in the same row-major order get_blocks used to produce
+            piece_offsets.append(tuple((pos % 4, pos // 4) for pos in sorted(shape)))
+            # One bitmask per relative row: bit j set = relative column j occupied
+            masks: List[int] = [0, 0, 0, 0]
+            for pos in shape:
+                masks[pos // 4] |= 1 << (pos % 4)
+            piece_masks.append(tuple(masks))
+        offsets_table.append(tuple(piece_offsets))
+        masks_table.append(tuple(piece_masks))
+    return tuple(offsets_table), tuple(masks_table)
+
+
+# Computed once at import time and shared by every Piece and Board
+BLOCK_OFFSETS, ROW_MASKS = _build_shape_tables()
+
+# Block offsets as a (7, 4, 4, 2) int16 array; types with fewer than 4
+# rotations repeat their cycle so any rotation index stays valid
+BLOCK_OFFSETS_NP: np.ndarray = np.array(
+    [[rotations[r % len(rotations)] for r in range(4)] for rotations in BLOCK_OFFSETS],
+    dtype=np.int16,
+)
+
+# Bottom-most occupied relative row per (type, rotation), for the floor check
+MAX_ROWS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(max(pos // 4 for pos in shape) for shape in rotations)
+    for rotations in Piece.SHAPES
+)
+
+
+def _bottom_per_column(shape: List[int]) -> Tuple[Tuple[int, int], ...]:
+    """(column, bottom-most row) pairs for the occupied columns of a shape"""
+    bottoms: dict = {}
+    for pos in shape:
+        col, row = pos % 4, pos // 4
+        if row > bottoms.get(col, -1):
+            bottoms[col] = row
+    return tuple(sorted(bottoms.items()))
+
+
+# Per (type, rotation): bottom profile used for the analytic drop distance
+BOTTOM_PER_COL: Tuple[Tuple[Tuple[Tuple[int, int], ...], ...], ...] = tuple(
+    tuple(_bottom_per_column(shape) for shape in rotations)
+    for rotations in Piece.SHAPES
+)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from typing import Tuple, Optional, Dict, List, Any
 
 # Type aliases for better readability
@@ -28,6 +29,36 @@ ACCENT_COLOR: Color = (100, 200, 255)
 GRID_COLOR: Color = (45, 45, 65)
 PAUSE_OVERLAY: ColorWithAlpha = (0, 0, 0, 128)
 
+# Highlight shade per palette color, computed once instead of per block;
+# keyed by the color tuple so draw_block keeps its color argument, with
+# off-palette colors added on first use
+HIGHLIGHT_COLORS: Dict[Color, Color] = {
+    col: tuple(min(255, c + 30) for c in col) for col in COLORS
+}
+
+# Dimmed ghost shade per palette color, derived once at import
+GHOST_COLORS: List[Color] = [tuple(c // 3 for c in col) for col in COLORS]
+
+# Preview geometry per shape: (width, height, normalized block offsets).
+# Shapes are constant, so each one is measured once instead of per frame.
+_SHAPE_META: Dict[Tuple[int, ...], Tuple[int, int, List[Tuple[int, int]]]] = {}
+
+
+def _shape_meta(shape: Any) -> Tuple[int, int, List[Tuple[int, int]]]:
+    """Bounding box and zero-based block offsets for a 4x4 shape list"""
+    key: Tuple[int, ...] = tuple(shape)
+    meta: Optional[Tuple[int, int, List[Tuple[int, int]]]] = _SHAPE_META.get(key)
+    if meta is None:
+        cells: List[Tuple[int, int]] = [(pos % 4, pos // 4) for pos in shape]
+        min_x: int = min(cx for cx, _ in cells)
+        min_y: int = min(cy for _, cy in cells)
+        width: int = max(cx for cx, _ in cells) - min_x + 1
+        height: int = max(cy for _, cy in cells) - min_y + 1
+        blocks: List[Tuple[int, int]] = [(cx - min_x, cy - min_y) for cx, cy in cells]
+        meta = (width, height, blocks)
+        _SHAPE_META[key] = meta
+    return meta
+
 class TetrisRenderer:
     """Enhanced renderer supporting single and multiplayer modes"""
     
@@ -63,7 +94,128 @@ class TetrisRenderer:
             'small': pygame.font.Font(None, 18),
             'tiny': pygame.font.Font(None, 16)
         }
-    
+
+        # Board backgrounds (frame, border, grid lines) baked once per size
+        self._board_bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Full-screen gradient filled once through surfarray; render_* blits it
+        self._bg: pygame.Surface = pygame.Surface((screen_width, screen_height))
+        pixels: np.ndarray = pygame.surfarray.pixels3d(self._bg)  # (W, H, 3) view
+        intensity: np.ndarray = (15 + (np.arange(screen_height) / screen_height) * 10).astype(np.uint8)
+        pixels[:, :, 0] = intensity
+        pixels[:, :, 1] = intensity
+        pixels[:, :, 2] = intensity + 5
+        del pixels  # release the surface lock
+        self._bg = self._to_display(self._bg)
+
+        # One pre-rendered block (fill plus top highlight) per palette color
+        self._block_surfs: List[pygame.Surface] = [
+            self._build_block_surface(color) for color in COLORS
+        ]
+
+        # Per-frame blit batch: draw helpers append, render_* flushes once
+        self._blit_queue: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+        # Rendered text keyed by (font, text, color); labels are constant and
+        # numeric values repeat, so nearly every frame is all cache hits
+        self._text_cache: Dict[Tuple[str, str, Color], pygame.Surface] = {}
+
+        # Controls panels depend on nothing but literals; built on first use
+        self._controls_single: Optional[pygame.Surface] = None
+        self._controls_multi: Optional[pygame.Surface] = None
+
+        # Translucent blocks keyed by (color index, alpha), filled on demand
+        self._alpha_blocks: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # Ghost outlines, one per color, so the queue handles them too
+        self._ghost_surfs: List[pygame.Surface] = [
+            self._build_ghost_surface(i) for i in range(len(COLORS))
+        ]
+
+        # Red game-over overlay, allocated once and blitted per dead board
+        self._gameover_overlay: pygame.Surface = pygame.Surface((self.board_width, self.board_height))
+        self._gameover_overlay.fill((255, 0, 0))
+        self._gameover_overlay = self._to_display(self._gameover_overlay)
+        self._gameover_overlay.set_alpha(128)
+
+        # Static layers (gradient + board frames + placed blocks + panels),
+        # repainted only when the boards' state_version counters move
+        self._static_single: Optional[pygame.Surface] = None
+        self._static_single_version: int = -1
+        self._static_multi: Optional[pygame.Surface] = None
+        self._static_multi_versions: Tuple[int, int] = (-1, -1)
+
+        # Screen regions that change during play (boards incl. frame, stats
+        # panels); the main loop pushes only these via display.update instead
+        # of flipping the full screen every change frame
+        frame_w: int = self.board_width + 20
+        frame_h: int = self.board_height + 20
+        self.dirty_rects_single: List[pygame.Rect] = [
+            pygame.Rect(self.single_board_x - 10, self.single_board_y - 10, frame_w, frame_h),
+            pygame.Rect(self.single_panel_x, 50, self.single_panel_width, 400),
+        ]
+        self.dirty_rects_multi: List[pygame.Rect] = [
+            pygame.Rect(self.multi_board1_x - 10, self.multi_board_y - 10, frame_w, frame_h),
+            pygame.Rect(self.multi_board2_x - 10, self.multi_board_y - 10, frame_w, frame_h),
+            pygame.Rect(self.multi_panel1_x, 50, self.multi_panel_width, 400),
+            pygame.Rect(self.multi_panel2_x, 50, self.multi_panel_width, 400),
+        ]
+
+    @staticmethod
+    def _to_display(surf: pygame.Surface) -> pygame.Surface:
+        """Convert a cached surface to the display format for fast blits"""
+        if pygame.display.get_surface() is None:
+            return surf  # no display mode yet (headless): keep as-is
+        if surf.get_flags() & pygame.SRCALPHA:
+            return surf.convert_alpha()
+        return surf.convert()
+
+    def _text(self, font_key: str, text: str, color: Color) -> pygame.Surface:
+        """Memoized font.render with simple FIFO eviction"""
+        key: Tuple[str, str, Color] = (font_key, text, color)
+        surf: Optional[pygame.Surface] = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            surf = self._to_display(self.fonts[font_key].render(text, True, color))
+            self._text_cache[key] = surf
+        return surf
+
+    def _alpha_block(self, color_index: int, alpha: int) -> pygame.Surface:
+        """Cached translucent block surface for the given color and alpha"""
+        key: Tuple[int, int] = (color_index, alpha)
+        surf: Optional[pygame.Surface] = self._alpha_blocks.get(key)
+        if surf is None:
+            surf = pygame.Surface((self.block_size - 2, self.block_size - 2))
+            surf.fill(COLORS[color_index])
+            surf = self._to_display(surf)
+            surf.set_alpha(alpha)
+            self._alpha_blocks[key] = surf
+        return surf
+
+    def _flush_blits(self, surface: pygame.Surface) -> None:
+        """Dispatch every queued blit in one Surface.blits call"""
+        if self._blit_queue:
+            surface.blits(self._blit_queue, doreturn=0)
+            self._blit_queue.clear()
+
+    def _build_block_surface(self, color: Color, size: Optional[int] = None) -> pygame.Surface:
+        """Raster one block with its highlight baked in, for batched blitting"""
+        if size is None:
+            size = self.block_size
+        block: pygame.Surface = pygame.Surface((size - 2, size - 2), pygame.SRCALPHA)
+        pygame.draw.rect(block, color, [0, 0, size - 2, size - 2], border_radius=3)
+        pygame.draw.rect(block, HIGHLIGHT_COLORS[color], [0, 0, size - 2, 4], border_radius=3)
+        return self._to_display(block)
+
+    def _build_ghost_surface(self, color_index: int) -> pygame.Surface:
+        """Raster one ghost outline (dimmed color, 2px border) for blitting"""
+        size: int = self.block_size
+        outline: pygame.Surface = pygame.Surface((size - 4, size - 4), pygame.SRCALPHA)
+        pygame.draw.rect(outline, GHOST_COLORS[color_index], [0, 0, size - 4, size - 4],
+                         2, border_radius=2)
+        return self._to_display(outline)
+
     def draw_rounded_rect(self, surface: pygame.Surface, color: Color, rect: pygame.Rect, radius: int = 10) -> None:
         """Draw a rounded rectangle"""
         pygame.draw.rect(surface, color, rect, border_radius=radius)
@@ -75,39 +227,58 @@ class TetrisRenderer:
             
         # Main block
         pygame.draw.rect(surface, color, [x, y, size-2, size-2], border_radius=border_radius)
-        
-        # Highlight effect
-        highlight_color: Color = (
-            min(255, color[0] + 30),
-            min(255, color[1] + 30),
-            min(255, color[2] + 30),
-        )
+
+        # Highlight effect, from the precomputed table
+        highlight_color: Optional[Color] = HIGHLIGHT_COLORS.get(color)
+        if highlight_color is None:
+            highlight_color = tuple(min(255, c + 30) for c in color)
+            HIGHLIGHT_COLORS[color] = highlight_color
         pygame.draw.rect(surface, highlight_color, [x, y, size-2, 4], border_radius=border_radius)
     
     def draw_board_background(self, surface: pygame.Surface, x: int, y: int, width: int, height: int) -> None:
         """Draw the game board background and grid"""
+        # The background never changes: bake it once per size and blit after
+        cached: Optional[pygame.Surface] = self._board_bg_cache.get((width, height))
+        if cached is None:
+            cached = self._build_board_background(width, height)
+            self._board_bg_cache[(width, height)] = cached
+        surface.blit(cached, (x - 10, y - 10))
+
+    def _build_board_background(self, width: int, height: int) -> pygame.Surface:
+        """Render the board frame, border and grid lines into a new surface"""
+        bg: pygame.Surface = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
+
         # Board background
-        board_rect: pygame.Rect = pygame.Rect(x - 10, y - 10, width + 20, height + 20)
-        self.draw_rounded_rect(surface, LIGHTER_BG, board_rect, 8)
-        pygame.draw.rect(surface, BORDER_COLOR, board_rect, 2, border_radius=8)
-        
-        # Grid lines
-        for i in range(21):  # 20 rows + 1
+        board_rect: pygame.Rect = pygame.Rect(0, 0, width + 20, height + 20)
+        self.draw_rounded_rect(bg, LIGHTER_BG, board_rect, 8)
+        pygame.draw.rect(bg, BORDER_COLOR, board_rect, 2, border_radius=8)
+
+        # Grid lines: one Rect moved around the 200 cells instead of 200 Rects
+        bs: int = self.block_size
+        rect: pygame.Rect = pygame.Rect(0, 0, bs, bs)
+        for i in range(20):  # rows
             for j in range(11):  # 10 cols + 1
-                if i < 20:
-                    rect: pygame.Rect = pygame.Rect(x + self.block_size * j, y + self.block_size * i,
-                                                   self.block_size, self.block_size)
-                    pygame.draw.rect(surface, GRID_COLOR, rect, 1)
+                rect.x = 10 + bs * j
+                rect.y = 10 + bs * i
+                pygame.draw.rect(bg, GRID_COLOR, rect, 1)
+        return self._to_display(bg)
     
     def draw_placed_blocks(self, surface: pygame.Surface, board: Any, board_x: int, board_y: int) -> None:
         """Draw all placed blocks on the board"""
+        bs: int = self.block_size
+        max_color: int = len(COLORS) - 1
+        blits = self._blit_queue
+        occ = board.occ
         for i in range(board.height):
-            for j in range(board.width):
-                if board.grid[i][j] > 0:
-                    color: Color = COLORS[min(board.grid[i][j], len(COLORS)-1)]
-                    self.draw_block(surface, color,
-                                  board_x + self.block_size * j + 1,
-                                  board_y + self.block_size * i + 1)
+            # The occupancy bitboard rules out empty rows without touching the grid
+            if not occ[i]:
+                continue
+            row = board.grid[i]
+            y: int = board_y + bs * i + 1
+            # Vectorized column scan: one nonzero call per occupied row
+            for j in np.nonzero(np.frombuffer(row, dtype=np.uint16))[0]:
+                blits.append((self._block_surfs[min(row[j], max_color)],
+                              (board_x + bs * j + 1, y)))
     
     def draw_piece(self, surface: pygame.Surface, piece: Any, board_x: int, board_y: int, alpha: int = 255) -> None:
         """Draw a piece on the board"""
@@ -122,13 +293,10 @@ class TetrisRenderer:
                 y: int = board_y + self.block_size * block_y + 1
                 
                 if alpha < 255:
-                    # Create surface for transparency
-                    temp_surface: pygame.Surface = pygame.Surface((self.block_size-2, self.block_size-2))
-                    temp_surface.set_alpha(alpha)
-                    temp_surface.fill(color)
-                    surface.blit(temp_surface, (x, y))
+                    # Cached translucent block: no per-frame surface churn
+                    self._blit_queue.append((self._alpha_block(piece.color, alpha), (x, y)))
                 else:
-                    self.draw_block(surface, color, x, y)
+                    self._blit_queue.append((self._block_surfs[piece.color], (x, y)))
     
     def draw_ghost_piece(self, surface: pygame.Surface, board: Any, board_x: int, board_y: int) -> None:
         """Draw ghost piece showing where current piece will land"""
@@ -138,10 +306,7 @@ class TetrisRenderer:
                 if 0 <= block_x < 10 and 0 <= block_y < 20:
                     x: int = board_x + self.block_size * block_x + 2
                     y: int = board_y + self.block_size * block_y + 2
-                    ghost_color: Color = tuple(c // 3 for c in COLORS[ghost_piece.color])
-                    pygame.draw.rect(surface, ghost_color,
-                                   [x, y, self.block_size - 4, self.block_size - 4],
-                                   2, border_radius=2)
+                    self._blit_queue.append((self._ghost_surfs[ghost_piece.color], (x, y)))
     
     def draw_piece_preview(self, surface: pygame.Surface, piece: Any, x: int, y: int, title: str, size: int = 16) -> None:
         """Draw a piece preview with title"""
@@ -154,39 +319,21 @@ class TetrisRenderer:
         pygame.draw.rect(surface, BORDER_COLOR, panel_rect, 2, border_radius=6)
         
         # Title
-        text: pygame.Surface = self.fonts['small'].render(title, True, TEXT_SECONDARY)
+        text: pygame.Surface = self._text('small', title, TEXT_SECONDARY)
         surface.blit(text, (x, y - 5))
         
-        # Calculate piece bounds for centering
-        shape: Any = piece.get_shape()
-        min_x: int = 4
-        min_y: int = 4
-        max_x: int = -1
-        max_y: int = -1
-        
-        for i in range(4):
-            for j in range(4):
-                if i * 4 + j in shape:
-                    min_x = min(min_x, j)
-                    max_x = max(max_x, j)
-                    min_y = min(min_y, i)
-                    max_y = max(max_y, i)
-        
-        if max_x >= 0:  # Valid piece
-            piece_width: int = max_x - min_x + 1
-            piece_height: int = max_y - min_y + 1
-            
-            # Center the piece
-            offset_x: int = (4 * size - piece_width * size) // 2
-            offset_y: int = (4 * size - piece_height * size) // 2
-            
-            # Draw piece
-            for i in range(4):
-                for j in range(4):
-                    if i * 4 + j in shape:
-                        block_x: int = x + 10 + offset_x + (j - min_x) * size
-                        block_y: int = y + 15 + offset_y + (i - min_y) * size
-                        self.draw_block(surface, COLORS[piece.color], block_x, block_y, size)
+        # Precomputed bounds and offsets replace the 4x4 membership scans
+        piece_width, piece_height, blocks = _shape_meta(piece.get_shape())
+
+        # Center the piece
+        offset_x: int = (4 * size - piece_width * size) // 2
+        offset_y: int = (4 * size - piece_height * size) // 2
+
+        # Draw piece
+        for dj, di in blocks:
+            block_x: int = x + 10 + offset_x + dj * size
+            block_y: int = y + 15 + offset_y + di * size
+            self.draw_block(surface, COLORS[piece.color], block_x, block_y, size)
     
     def draw_stats_panel(self, surface: pygame.Surface, board: Any, x: int, y: int, width: int, player_name: str = "PLAYER") -> None:
         """Draw player statistics panel"""
@@ -196,29 +343,29 @@ class TetrisRenderer:
         pygame.draw.rect(surface, BORDER_COLOR, panel_rect, 2, border_radius=8)
         
         # Player name
-        player_text: pygame.Surface = self.fonts['medium'].render(player_name, True, ACCENT_COLOR)
+        player_text: pygame.Surface = self._text('medium', player_name, ACCENT_COLOR)
         surface.blit(player_text, (x + 10, y + 10))
         
         current_y: int = y + 40
         
         # Score
-        score_label: pygame.Surface = self.fonts['small'].render("SCORE", True, TEXT_SECONDARY)
+        score_label: pygame.Surface = self._text('small', "SCORE", TEXT_SECONDARY)
         surface.blit(score_label, (x + 10, current_y))
-        score_text: pygame.Surface = self.fonts['medium'].render(f"{board.score:,}", True, TEXT_PRIMARY)
+        score_text: pygame.Surface = self._text('medium', f"{board.score:,}", TEXT_PRIMARY)
         surface.blit(score_text, (x + 10, current_y + 18))
         current_y += 50
         
         # Level
-        level_label: pygame.Surface = self.fonts['small'].render("LEVEL", True, TEXT_SECONDARY)
+        level_label: pygame.Surface = self._text('small', "LEVEL", TEXT_SECONDARY)
         surface.blit(level_label, (x + 10, current_y))
-        level_text: pygame.Surface = self.fonts['medium'].render(str(board.level), True, TEXT_PRIMARY)
+        level_text: pygame.Surface = self._text('medium', str(board.level), TEXT_PRIMARY)
         surface.blit(level_text, (x + 10, current_y + 18))
         current_y += 50
         
         # Lines
-        lines_label: pygame.Surface = self.fonts['small'].render("LINES", True, TEXT_SECONDARY)
+        lines_label: pygame.Surface = self._text('small', "LINES", TEXT_SECONDARY)
         surface.blit(lines_label, (x + 10, current_y))
-        lines_text: pygame.Surface = self.fonts['medium'].render(str(board.lines_cleared), True, TEXT_PRIMARY)
+        lines_text: pygame.Surface = self._text('medium', str(board.lines_cleared), TEXT_PRIMARY)
         surface.blit(lines_text, (x + 10, current_y + 18))
         current_y += 60
         
@@ -235,23 +382,39 @@ class TetrisRenderer:
             empty_rect: pygame.Rect = pygame.Rect(x + 2, current_y - 8, 90, 80)
             self.draw_rounded_rect(surface, LIGHTER_BG, empty_rect, 6)
             pygame.draw.rect(surface, BORDER_COLOR, empty_rect, 2, border_radius=6)
-            text: pygame.Surface = self.fonts['small'].render("HOLD", True, TEXT_SECONDARY)
+            text: pygame.Surface = self._text('small', "HOLD", TEXT_SECONDARY)
             surface.blit(text, (x + 10, current_y - 5))
     
     def draw_controls(self, surface: pygame.Surface, x: int, y: int, multiplayer: bool = False) -> None:
         """Draw control instructions"""
-        controls_label: pygame.Surface = self.fonts['medium'].render("CONTROLS", True, TEXT_SECONDARY)
+        # The whole panel is literal text; bake it once and blit it per frame
+        if multiplayer:
+            if self._controls_multi is None:
+                self._controls_multi = self._build_controls_surface(True)
+            surface.blit(self._controls_multi, (x, y))
+        else:
+            if self._controls_single is None:
+                self._controls_single = self._build_controls_surface(False)
+            surface.blit(self._controls_single, (x, y))
+
+    def _build_controls_surface(self, multiplayer: bool) -> pygame.Surface:
+        """Render the static controls panel for one mode"""
+        surface: pygame.Surface = pygame.Surface((420 if multiplayer else 220, 200),
+                                                 pygame.SRCALPHA)
+        x: int = 0
+        y: int = 0
+        controls_label: pygame.Surface = self._text('medium', "CONTROLS", TEXT_SECONDARY)
         surface.blit(controls_label, (x, y))
-        
+
         current_y: int = y + 25
-        
+
         if multiplayer:
             # Create two columns for multiplayer controls
             col1_x: int = x
             col2_x: int = x + 200
             
             # Player 1 controls (left column)
-            p1_title: pygame.Surface = self.fonts['medium'].render("PLAYER 1:", True, TEXT_PRIMARY)
+            p1_title: pygame.Surface = self._text('medium', "PLAYER 1:", TEXT_PRIMARY)
             surface.blit(p1_title, (col1_x, current_y))
             
             p1_controls: List[str] = [
@@ -264,12 +427,12 @@ class TetrisRenderer:
             
             control_y: int = current_y + 20
             for control in p1_controls:
-                control_text: pygame.Surface = self.fonts['small'].render(control, True, TEXT_SECONDARY)
+                control_text: pygame.Surface = self._text('small', control, TEXT_SECONDARY)
                 surface.blit(control_text, (col1_x, control_y))
                 control_y += 16
             
             # Player 2 controls (right column)
-            p2_title: pygame.Surface = self.fonts['medium'].render("PLAYER 2:", True, TEXT_PRIMARY)
+            p2_title: pygame.Surface = self._text('medium', "PLAYER 2:", TEXT_PRIMARY)
             surface.blit(p2_title, (col2_x, current_y))
             
             p2_controls: List[str] = [
@@ -282,13 +445,13 @@ class TetrisRenderer:
             
             control_y = current_y + 20
             for control in p2_controls:
-                control_text: pygame.Surface = self.fonts['small'].render(control, True, TEXT_SECONDARY)
+                control_text: pygame.Surface = self._text('small', control, TEXT_SECONDARY)
                 surface.blit(control_text, (col2_x, control_y))
                 control_y += 16
             
             # Common controls at the bottom
             common_y: int = control_y + 15
-            common_text: pygame.Surface = self.fonts['small'].render("P Pause  |  ESC Menu", True, TEXT_SECONDARY)
+            common_text: pygame.Surface = self._text('small', "P Pause  |  ESC Menu", TEXT_SECONDARY)
             surface.blit(common_text, (col1_x, common_y))
             
         else:
@@ -308,97 +471,102 @@ class TetrisRenderer:
                 if control == "":
                     current_y += 10
                     continue
-                font: pygame.font.Font = self.fonts['small'] if not control.endswith(":") else self.fonts['medium']
+                font_key: str = 'small' if not control.endswith(":") else 'medium'
                 color: Color = TEXT_PRIMARY if control.endswith(":") else TEXT_SECONDARY
-                control_text: pygame.Surface = font.render(control, True, color)
+                control_text: pygame.Surface = self._text(font_key, control, color)
                 surface.blit(control_text, (x, current_y))
                 current_y += 16
-    
+
+        return self._to_display(surface)
+
+    def _single_layer(self, board: Any) -> pygame.Surface:
+        """Static single-player layer, repainted only when the board changed"""
+        layer: Optional[pygame.Surface] = self._static_single
+        if layer is not None and self._static_single_version == board.state_version:
+            return layer
+        if layer is None:
+            layer = self._to_display(pygame.Surface((self.screen_width, self.screen_height)))
+            self._static_single = layer
+        layer.blit(self._bg, (0, 0))
+        self.draw_board_background(layer, self.single_board_x, self.single_board_y,
+                                   self.board_width, self.board_height)
+        self.draw_placed_blocks(layer, board, self.single_board_x, self.single_board_y)
+        self._flush_blits(layer)
+        self.draw_stats_panel(layer, board, self.single_panel_x, 50, self.single_panel_width)
+        self.draw_controls(layer, self.single_panel_x + 10, 480)
+        self._static_single_version = board.state_version
+        return layer
+
+    def _multi_layer(self, board1: Any, board2: Any) -> pygame.Surface:
+        """Static multiplayer layer, repainted only when either board changed"""
+        versions: Tuple[int, int] = (board1.state_version, board2.state_version)
+        layer: Optional[pygame.Surface] = self._static_multi
+        if layer is not None and self._static_multi_versions == versions:
+            return layer
+        if layer is None:
+            layer = self._to_display(pygame.Surface((self.screen_width, self.screen_height)))
+            self._static_multi = layer
+        layer.blit(self._bg, (0, 0))
+        self.draw_board_background(layer, self.multi_board1_x, self.multi_board_y,
+                                   self.board_width, self.board_height)
+        self.draw_placed_blocks(layer, board1, self.multi_board1_x, self.multi_board_y)
+        self.draw_board_background(layer, self.multi_board2_x, self.multi_board_y,
+                                   self.board_width, self.board_height)
+        self.draw_placed_blocks(layer, board2, self.multi_board2_x, self.multi_board_y)
+        self._flush_blits(layer)
+        self.draw_stats_panel(layer, board1, self.multi_panel1_x, 50, self.multi_panel_width, "PLAYER 1")
+        self.draw_stats_panel(layer, board2, self.multi_panel2_x, 50, self.multi_panel_width, "PLAYER 2")
+        self.draw_controls(layer, 300, 580, multiplayer=True)
+        self._static_multi_versions = versions
+        return layer
+
+    def _draw_game_over(self, surface: pygame.Surface, x: int, y: int) -> None:
+        """Dim a dead board and stamp the GAME OVER text, all from caches"""
+        surface.blit(self._gameover_overlay, (x, y))
+        surface.blit(self._text('large', "GAME", TEXT_PRIMARY), (x + 50, y + 200))
+        surface.blit(self._text('large', "OVER", TEXT_PRIMARY), (x + 50, y + 230))
+
     def render_single_player(self, surface: pygame.Surface, board: Any) -> None:
         """Render single player mode"""
-        # Clear screen with gradient
-        for y in range(self.screen_height):
-            intensity: int = int(15 + (y / self.screen_height) * 10)
-            pygame.draw.line(surface, (intensity, intensity, intensity + 5), 
-                           (0, y), (self.screen_width, y))
-        
-        # Draw board
-        self.draw_board_background(surface, self.single_board_x, self.single_board_y, 
-                                 self.board_width, self.board_height)
-        self.draw_placed_blocks(surface, board, self.single_board_x, self.single_board_y)
+        # Static layer first: most frames it is one full-screen blit
+        surface.blit(self._single_layer(board), (0, 0))
+
+        # Ghost and current piece move between drops; draw them per frame
         self.draw_ghost_piece(surface, board, self.single_board_x, self.single_board_y)
         self.draw_piece(surface, board.current_piece, self.single_board_x, self.single_board_y)
-        
-        # Draw UI panel
-        self.draw_stats_panel(surface, board, self.single_panel_x, 50, self.single_panel_width)
-        
-        # Draw controls
-        self.draw_controls(surface, self.single_panel_x + 10, 480)
-        
+        self._flush_blits(surface)
+
         # Pause indicator
         if board.paused:
-            pause_text: pygame.Surface = self.fonts['large'].render("PAUSED", True, (255, 255, 0))
+            pause_text: pygame.Surface = self._text('large', "PAUSED", (255, 255, 0))
             pause_rect: pygame.Rect = pause_text.get_rect(center=(self.single_board_x + self.board_width//2, 
                                                                  self.single_board_y + self.board_height//2))
             surface.blit(pause_text, pause_rect)
     
     def render_multiplayer(self, surface: pygame.Surface, board1: Any, board2: Any) -> None:
         """Render multiplayer mode"""
-        # Clear screen with gradient
-        for y in range(self.screen_height):
-            intensity: int = int(15 + (y / self.screen_height) * 10)
-            pygame.draw.line(surface, (intensity, intensity, intensity + 5), 
-                           (0, y), (self.screen_width, y))
-        
-        # Draw Player 1 board
-        self.draw_board_background(surface, self.multi_board1_x, self.multi_board_y, 
-                                 self.board_width, self.board_height)
-        self.draw_placed_blocks(surface, board1, self.multi_board1_x, self.multi_board_y)
+        # Static layer first: most frames it is one full-screen blit
+        surface.blit(self._multi_layer(board1, board2), (0, 0))
+
+        # Ghosts and current pieces move between drops; draw them per frame
         self.draw_ghost_piece(surface, board1, self.multi_board1_x, self.multi_board_y)
         self.draw_piece(surface, board1.current_piece, self.multi_board1_x, self.multi_board_y)
-        
-        # Draw Player 2 board
-        self.draw_board_background(surface, self.multi_board2_x, self.multi_board_y, 
-                                 self.board_width, self.board_height)
-        self.draw_placed_blocks(surface, board2, self.multi_board2_x, self.multi_board_y)
         self.draw_ghost_piece(surface, board2, self.multi_board2_x, self.multi_board_y)
         self.draw_piece(surface, board2.current_piece, self.multi_board2_x, self.multi_board_y)
-        
-        # Draw UI panels
-        self.draw_stats_panel(surface, board1, self.multi_panel1_x, 50, self.multi_panel_width, "PLAYER 1")
-        self.draw_stats_panel(surface, board2, self.multi_panel2_x, 50, self.multi_panel_width, "PLAYER 2")
-        
-        # Draw controls - positioned at the bottom center
-        self.draw_controls(surface, 300, 580, multiplayer=True)
-        
+        self._flush_blits(surface)
+
         # Game over indicators
         if board1.game_over:
-            overlay: pygame.Surface = pygame.Surface((self.board_width, self.board_height))
-            overlay.set_alpha(128)
-            overlay.fill((255, 0, 0))
-            surface.blit(overlay, (self.multi_board1_x, self.multi_board_y))
-            
-            game_over_text: pygame.Surface = self.fonts['large'].render("GAME", True, (255, 255, 255))
-            over_text: pygame.Surface = self.fonts['large'].render("OVER", True, (255, 255, 255))
-            surface.blit(game_over_text, (self.multi_board1_x + 50, self.multi_board_y + 200))
-            surface.blit(over_text, (self.multi_board1_x + 50, self.multi_board_y + 230))
-        
+            self._draw_game_over(surface, self.multi_board1_x, self.multi_board_y)
+
         if board2.game_over:
-            overlay: pygame.Surface = pygame.Surface((self.board_width, self.board_height))
-            overlay.set_alpha(128)
-            overlay.fill((255, 0, 0))
-            surface.blit(overlay, (self.multi_board2_x, self.multi_board_y))
-            
-            game_over_text: pygame.Surface = self.fonts['large'].render("GAME", True, (255, 255, 255))
-            over_text: pygame.Surface = self.fonts['large'].render("OVER", True, (255, 255, 255))
-            surface.blit(game_over_text, (self.multi_board2_x + 50, self.multi_board_y + 200))
-            surface.blit(over_text, (self.multi_board2_x + 50, self.multi_board_y + 230))
+            self._draw_game_over(surface, self.multi_board2_x, self.multi_board_y)
         
         # Pause indicators
         if board1.paused:
-            pause_text: pygame.Surface = self.fonts['medium'].render("PAUSED", True, (255, 255, 0))
+            pause_text: pygame.Surface = self._text('medium', "PAUSED", (255, 255, 0))
             surface.blit(pause_text, (self.multi_board1_x + 30, self.multi_board_y + 250))
         
         if board2.paused:
-            pause_text: pygame.Surface = self.fonts['medium'].render("PAUSED", True, (255, 255, 0))
+            pause_text: pygame.Surface = self._text('medium', "PAUSED", (255, 255, 0))
             surface.blit(pause_text, (self.multi_board2_x + 30, self.multi_board_y + 250))
\ No newline at end of file
@@ -0,0 +1,61 @@
+import os
+import sys
+from pathlib import Path
+
+# Add project root to Python path once for every test module; conftest
+# loads before the tests, so the per-file sys.path blocks are gone
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Headless SDL driver: no window or GPU context, the biggest pygame init cost
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+
+import numpy as np
+import pytest
+
+# pygame stays out of module scope so that a box without it can still
+# collect and run the pure-logic board/piece tests
+from src.board import Board
+
+
+@pytest.fixture(autouse=True)
+def _seed_rng():
+    """Seed the RNGs before every test so piece draws are deterministic"""
+    random.seed(0)
+    np.random.seed(0)
+
+
+@pytest.fixture(scope="session")
+def tetris_game():
+    """One TetrisGame instance (and one pygame/SDL init) for the whole run"""
+    pygame = pytest.importorskip("pygame")
+    from src.main import TetrisGame
+
+    game = TetrisGame()
+    yield game
+    pygame.quit()
+
+
+@pytest.fixture
+def board_factory():
+    """Factory for fresh Board instances"""
+    return Board
+
+
+@pytest.fixture(scope="session")
+def _board_instance():
+    return Board()
+
+
+@pytest.fixture(scope="session")
+def pristine_board():
+    """Untouched board that tests deep-copy instead of re-running __init__"""
+    return Board()
+
+
+@pytest.fixture
+def board(_board_instance):
+    """A standard 10x20 board, reset between tests instead of reallocated"""
+    _board_instance.reset()
+    return _board_instance
@@ -1,9 +1,13 @@
-import pytest
-import sys
+import copy
 import os
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
+
+# Project root is put on sys.path by tests/conftest.py
+
+# Skip the whole module cleanly on environments without pygame/SDL
+pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 from src.board import Board
 from src.piece import Piece
@@ -13,25 +17,15 @@ from src.main import TetrisGame, GameState
 class TestGameLogic:
     """Test cases for overall Tetris game logic integration"""
     
-    def test_game_initialization(self):
+    def test_game_initialization(self, tetris_game):
         """Test that game initializes properly"""
-        # Note: This test may need to be modified if pygame isn't available in test environment
-        try:
-            game = TetrisGame()
-            assert game.width == 1000
-            assert game.height == 700
-            assert game.state == GameState.MENU
-            assert game.running == True
-            assert isinstance(game.board1, Board)
-            assert isinstance(game.board2, Board)
-            # Cleanup to avoid pygame issues: remove the attribute instead of assigning None
-            if hasattr(game, "screen"):
-                delattr(game, "screen")
-        except Exception as e:
-            # If pygame isn't available, test basic class structure
-            assert GameState.MENU.value == "menu"
-            assert GameState.SINGLE_PLAYER.value == "single"
-            assert GameState.MULTIPLAYER.value == "multiplayer"
+        # The session-scoped fixture pays the pygame/SDL init cost once
+        assert tetris_game.width == 1000
+        assert tetris_game.height == 700
+        assert tetris_game.state == GameState.MENU
+        assert tetris_game.running == True
+        assert isinstance(tetris_game.board1, Board)
+        assert isinstance(tetris_game.board2, Board)
 
     def test_piece_spawn_and_placement_integration(self):
         """Test full piece lifecycle: spawn -> move -> lock -> clear"""
@@ -48,14 +42,12 @@ class TestGameLogic:
         if success:
             assert board.current_piece.x == original_pos[0] + 1
             
-    def test_complete_line_clearing_workflow(self):
+    def test_complete_line_clearing_workflow(self, board):
         """Test complete workflow of filling and clearing lines"""
-        board = Board()
-        
         # Fill bottom row except one space
         bottom_row = board.height - 1
-        for x in range(board.width - 1):
-            board.grid[bottom_row][x] = 1
+        board.fill_row(bottom_row, 1)
+        board.set_cell(board.width - 1, bottom_row, 0)
             
         # Create a piece that will complete the line
         piece = Piece(x=board.width - 1, y=bottom_row)
@@ -64,7 +56,7 @@ class TestGameLogic:
         # Simulate placing the piece
         for block_x, block_y in piece.get_blocks():
             if 0 <= block_y < board.height and 0 <= block_x < board.width:
-                board.grid[block_y][block_x] = piece.color
+                board.set_cell(block_x, block_y, piece.color)
                 
         # Clear lines
         original_score = board.score
@@ -86,8 +78,7 @@ class TestGameLogic:
         
         # Fill the top rows to simulate game over condition
         for y in range(3):  # Fill top 3 rows
-            for x in range(board.width):
-                board.grid[y][x] = 1
+            board.fill_row(y, 1)
                 
         # Try to spawn a new piece - should trigger game over
         board.spawn_piece()
@@ -153,10 +144,13 @@ class TestGameLogic:
             # Hard drop should have moved piece further and added to score
             assert board.score >= original_score  # Hard drop gives points
             
-    def test_multiplayer_board_independence(self):
+    def test_multiplayer_board_independence(self, pristine_board):
         """Test that multiplayer boards operate independently"""
-        board1 = Board(player_id=1)
-        board2 = Board(player_id=2)
+        # Cloning the pristine fixture is one memcpy-ish deepcopy per board
+        board1 = copy.deepcopy(pristine_board)
+        board1.player_id = 1
+        board2 = copy.deepcopy(pristine_board)
+        board2.player_id = 2
         
         # Modify board1
         board1.score = 1000
@@ -177,17 +171,15 @@ class TestGameLogic:
     def test_level_progression_affects_speed(self):
         """Test that level progression changes drop speed"""
         board = Board()
-        
-        # Test speed at level 1
-        board.level = 1
-        speed_1 = board.get_drop_speed()
-        
-        # Test speed at higher level
-        board.level = 10
-        speed_10 = board.get_drop_speed()
-        
+
+        # Sample a few levels and check the curve is decreasing in one go
+        speeds = []
+        for level in (1, 5, 10):
+            board.level = level
+            speeds.append(board.get_drop_speed())
+
         # Higher level should mean faster speed (lower number)
-        assert speed_10 < speed_1
+        assert speeds[0] > speeds[1] > speeds[2]
         
     def test_scoring_scales_with_level(self):
         """Test that scoring scales with current level"""
@@ -199,8 +191,7 @@ class TestGameLogic:
         
         # Fill a line for clearing
         bottom_row = board.height - 1
-        for x in range(board.width):
-            board.grid[bottom_row][x] = 1
+        board.fill_row(bottom_row, 1)
             
         lines_cleared = board.clear_lines()
         if lines_cleared > 0:
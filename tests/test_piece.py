@@ -1,11 +1,9 @@
 import pytest
-import sys
-import os
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import numpy as np
 
-from src.piece import Piece
+# Project root is put on sys.path by tests/conftest.py
+from src.piece import Piece, BLOCK_OFFSETS, BLOCK_OFFSETS_NP
 
 
 class TestPiece:
@@ -54,26 +52,17 @@ class TestPiece:
     def test_piece_movement(self):
         """Test piece movement in all directions"""
         piece = Piece(x=5, y=5)
-        
-        # Test moving right
-        piece.move(1, 0)
-        assert piece.x == 6
-        assert piece.y == 5
-        
-        # Test moving left
-        piece.move(-2, 0)
-        assert piece.x == 4
-        assert piece.y == 5
-        
-        # Test moving down
-        piece.move(0, 3)
-        assert piece.x == 4
-        assert piece.y == 8
-        
-        # Test moving up
-        piece.move(0, -1)
-        assert piece.x == 4
-        assert piece.y == 7
+
+        # Apply right, left, down and up moves, recording each position
+        moves = np.array([(1, 0), (-2, 0), (0, 3), (0, -1)])
+        positions = []
+        for dx, dy in moves:
+            piece.move(int(dx), int(dy))
+            positions.append((piece.x, piece.y))
+
+        # Each position must equal the starting point plus the running sum
+        expected = moves.cumsum(axis=0) + (5, 5)
+        assert np.array_equal(np.array(positions), expected)
         
     def test_piece_copy(self):
         """Test that piece copy creates independent duplicate"""
@@ -132,18 +121,20 @@ class TestPiece:
             
     def test_all_piece_types_have_valid_shapes(self):
         """Test that all piece types have valid shape definitions"""
-        for piece_type in range(7):  # 0-6 for I,Z,S,T,J,L,O
-            piece = Piece()
-            piece.type = piece_type
-            
-            # Check that each piece type has at least one rotation
-            assert len(piece.SHAPES[piece_type]) >= 1
-            
-            # Check that each rotation has exactly 4 blocks
-            for rotation in range(len(piece.SHAPES[piece_type])):
-                piece.rotation = rotation
-                blocks = piece.get_blocks()
-                assert len(blocks) == 4
+        # get_blocks serves straight from the import-time offset table, so
+        # validating that table covers every type/rotation in one pass
+        assert len(BLOCK_OFFSETS) == 7  # I, Z, S, T, J, L, O
+
+        for piece_type, rotations in enumerate(BLOCK_OFFSETS):
+            # Each piece type has at least one rotation, matching SHAPES
+            assert len(rotations) >= 1
+            assert len(rotations) == len(Piece.SHAPES[piece_type])
+
+            # Each rotation has exactly 4 blocks
+            assert all(len(offsets) == 4 for offsets in rotations)
+
+        # The vectorized mirror carries the same data, rotations cycled to 4
+        assert BLOCK_OFFSETS_NP.shape == (7, 4, 4, 2)
                 
     def test_shape_consistency(self):
         """Test that get_shape returns valid shape data"""